@@ -4,7 +4,7 @@
 from dagster import check
 from dagster.core.storage.tags import DOCKER_IMAGE_TAG
 from dagster.core.test_utils import create_run_for_test
-from dagster.utils import load_yaml_from_path, merge_dicts
+from dagster.utils import load_yaml_from_path
 from dagster_k8s.client import DagsterKubernetesClient
 from dagster_k8s.launcher import K8sRunLauncher
 from dagster_k8s.test import wait_for_job_and_get_raw_logs
@@ -18,36 +18,64 @@
     get_test_project_location_and_external_pipeline,
 )
 
+_ENV_PATH = get_test_project_environments_path()
+_PULL_POLICY = image_pull_policy()
+_ENV_CONFIG_MAPS = ["dagster-pipeline-env"] + (
+    [TEST_AWS_CONFIGMAP_NAME] if not IS_BUILDKITE else []
+)
+
+
+@pytest.fixture(scope="session")
+def base_run_config():
+    # Shared across tests - extend it with {**base_run_config, ...} rather than mutating it
+    return {
+        **load_yaml_from_path(os.path.join(_ENV_PATH, "env.yaml")),
+        **load_yaml_from_path(os.path.join(_ENV_PATH, "env_s3.yaml")),
+    }
+
+
+@pytest.fixture(scope="session")
+def k8s_client(cluster_provider):  # pylint: disable=redefined-outer-name,unused-argument
+    # Share one client (and its connection pools) across the tests in this module. Depends on
+    # cluster_provider so that the kube config is loaded before the API clients are built
+    return DagsterKubernetesClient.production_client()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def assert_no_celery_workers(
+    k8s_client, helm_namespace_for_k8s_run_launcher
+):  # pylint: disable=redefined-outer-name
+    # sanity check that the Helm release didn't bring up any celery workers - this can't change
+    # between tests, so only ask the API server once
+    pods = k8s_client.core_api.list_namespaced_pod(namespace=helm_namespace_for_k8s_run_launcher)
+    celery_pod_names = [p.metadata.name for p in pods.items if "celery-workers" in p.metadata.name]
+    check.invariant(not celery_pod_names)
+
 
 @pytest.mark.integration
 def test_k8s_run_launcher_default(
-    dagster_instance_for_k8s_run_launcher, helm_namespace_for_k8s_run_launcher, dagster_docker_image
-):
+    dagster_instance_for_k8s_run_launcher,
+    helm_namespace_for_k8s_run_launcher,
+    dagster_docker_image,
+    base_run_config,
+    k8s_client,
+):  # pylint: disable=redefined-outer-name
     # sanity check that we have a K8sRunLauncher
     check.inst(dagster_instance_for_k8s_run_launcher.run_launcher, K8sRunLauncher)
-    pods = DagsterKubernetesClient.production_client().core_api.list_namespaced_pod(
-        namespace=helm_namespace_for_k8s_run_launcher
-    )
-    celery_pod_names = [p.metadata.name for p in pods.items if "celery-workers" in p.metadata.name]
-    check.invariant(not celery_pod_names)
 
-    run_config = merge_dicts(
-        load_yaml_from_path(os.path.join(get_test_project_environments_path(), "env.yaml")),
-        load_yaml_from_path(os.path.join(get_test_project_environments_path(), "env_s3.yaml")),
-        {
-            "execution": {
-                "k8s": {
-                    "config": {
-                        "job_namespace": helm_namespace_for_k8s_run_launcher,
-                        "job_image": dagster_docker_image,
-                        "image_pull_policy": image_pull_policy(),
-                        "env_config_maps": ["dagster-pipeline-env"]
-                        + ([TEST_AWS_CONFIGMAP_NAME] if not IS_BUILDKITE else []),
-                    }
+    run_config = {
+        **base_run_config,
+        "execution": {
+            "k8s": {
+                "config": {
+                    "job_namespace": helm_namespace_for_k8s_run_launcher,
+                    "job_image": dagster_docker_image,
+                    "image_pull_policy": _PULL_POLICY,
+                    "env_config_maps": _ENV_CONFIG_MAPS,
                 }
-            },
+            }
         },
-    )
+    }
 
     pipeline_name = "demo_k8s_executor_pipeline"
     tags = {"key": "value"}
@@ -73,10 +101,12 @@ def test_k8s_run_launcher_default(
         )
 
         result = wait_for_job_and_get_raw_logs(
-            job_name="dagster-run-%s" % run.run_id, namespace=helm_namespace_for_k8s_run_launcher
+            job_name=f"dagster-run-{run.run_id}",
+            namespace=helm_namespace_for_k8s_run_launcher,
+            client=k8s_client,
         )
 
-        assert "PIPELINE_SUCCESS" in result, "no match, result: {}".format(result)
+        assert "PIPELINE_SUCCESS" in result, f"no match, result: {result}"
 
         updated_run = dagster_instance_for_k8s_run_launcher.get_run_by_id(run.run_id)
         assert updated_run.tags[DOCKER_IMAGE_TAG] == get_test_project_docker_image()
@@ -84,34 +114,29 @@ def test_k8s_run_launcher_default(
 
 @pytest.mark.integration
 def test_k8s_run_launcher_image_from_origin(
-    dagster_instance_for_k8s_run_launcher, helm_namespace_for_k8s_run_launcher, dagster_docker_image
-):
+    dagster_instance_for_k8s_run_launcher,
+    helm_namespace_for_k8s_run_launcher,
+    dagster_docker_image,
+    base_run_config,
+    k8s_client,
+):  # pylint: disable=redefined-outer-name
     # Like the previous test, but the executor doesn't supply an image - it's pulled
     # from the origin (see get_test_project_location_and_external_pipeline below) instead
 
     check.inst(dagster_instance_for_k8s_run_launcher.run_launcher, K8sRunLauncher)
-    pods = DagsterKubernetesClient.production_client().core_api.list_namespaced_pod(
-        namespace=helm_namespace_for_k8s_run_launcher
-    )
-    celery_pod_names = [p.metadata.name for p in pods.items if "celery-workers" in p.metadata.name]
-    check.invariant(not celery_pod_names)
 
-    run_config = merge_dicts(
-        load_yaml_from_path(os.path.join(get_test_project_environments_path(), "env.yaml")),
-        load_yaml_from_path(os.path.join(get_test_project_environments_path(), "env_s3.yaml")),
-        {
-            "execution": {
-                "k8s": {
-                    "config": {
-                        "job_namespace": helm_namespace_for_k8s_run_launcher,
-                        "image_pull_policy": image_pull_policy(),
-                        "env_config_maps": ["dagster-pipeline-env"]
-                        + ([TEST_AWS_CONFIGMAP_NAME] if not IS_BUILDKITE else []),
-                    }
+    run_config = {
+        **base_run_config,
+        "execution": {
+            "k8s": {
+                "config": {
+                    "job_namespace": helm_namespace_for_k8s_run_launcher,
+                    "image_pull_policy": _PULL_POLICY,
+                    "env_config_maps": _ENV_CONFIG_MAPS,
                 }
-            },
+            }
         },
-    )
+    }
 
     pipeline_name = "demo_k8s_executor_pipeline"
     tags = {"key": "value"}
@@ -139,10 +164,12 @@ def test_k8s_run_launcher_image_from_origin(
         )
 
         result = wait_for_job_and_get_raw_logs(
-            job_name="dagster-run-%s" % run.run_id, namespace=helm_namespace_for_k8s_run_launcher
+            job_name=f"dagster-run-{run.run_id}",
+            namespace=helm_namespace_for_k8s_run_launcher,
+            client=k8s_client,
         )
 
-        assert "PIPELINE_SUCCESS" in result, "no match, result: {}".format(result)
+        assert "PIPELINE_SUCCESS" in result, f"no match, result: {result}"
 
         updated_run = dagster_instance_for_k8s_run_launcher.get_run_by_id(run.run_id)
         assert updated_run.tags[DOCKER_IMAGE_TAG] == get_test_project_docker_image()
@@ -1,4 +1,5 @@
 import os
+import socket
 import sys
 import tempfile
 import threading
@@ -6,16 +7,13 @@
 from typing import Optional
 
 import click
-from dagster import check
+from dagster import check, seven
 from dagster.cli.workspace import Workspace, get_workspace_from_kwargs, workspace_target_argument
 from dagster.cli.workspace.cli_target import WORKSPACE_TARGET_WARNING
 from dagster.core.instance import DagsterInstance, is_dagster_home_set
 from dagster.core.telemetry import START_DAGIT_WEBSERVER, log_action
 from dagster.utils import DEFAULT_WORKSPACE_YAML_FILENAME
-from gevent import pywsgi
-from geventwebsocket.handler import WebSocketHandler
 
-from .app import create_app_from_workspace
 from .telemetry import upload_logs
 from .version import __version__
 
@@ -26,6 +24,7 @@ def create_dagit_cli():
 
 DEFAULT_DAGIT_HOST = "127.0.0.1"
 DEFAULT_DAGIT_PORT = 3000
+DEFAULT_PORT_LOOKUP_ATTEMPTS = 64
 
 DEFAULT_DB_STATEMENT_TIMEOUT = 5000  # 5 sec
 
@@ -151,6 +150,9 @@ def host_dagit_ui_with_workspace(
     check.bool_param(port_lookup, "port_lookup")
     check.bool_param(read_only, "read_only")
 
+    # Deferred so that e.g. `dagit --version` doesn't pay for importing the GraphQL schema
+    from .app import create_app_from_workspace
+
     app = create_app_from_workspace(workspace, instance, path_prefix, read_only)
 
     start_server(instance, host, port, path_prefix, app, port_lookup)
@@ -159,61 +161,85 @@ def host_dagit_ui_with_workspace(
 @contextmanager
 def uploading_logging_thread():
     stop_event = threading.Event()
+    # Daemon thread so that an in-flight upload never holds up dagit shutdown - setting the event
+    # wakes the thread from its wait immediately, no need to join it
     logging_thread = threading.Thread(
-        target=upload_logs, args=([stop_event]), name="telemetry-upload"
+        target=upload_logs, args=([stop_event]), name="telemetry-upload", daemon=True
     )
     try:
         logging_thread.start()
         yield
     finally:
         stop_event.set()
-        logging_thread.join()
 
 
-def start_server(instance, host, port, path_prefix, app, port_lookup, port_lookup_attempts=0):
-    server = pywsgi.WSGIServer((host, port), app, handler_class=WebSocketHandler)
+class DagitPortInUseError(Exception):
+    pass
 
-    click.echo(
-        "Serving on http://{host}:{port}{path_prefix} in process {pid}".format(
-            host=host, port=port, path_prefix=path_prefix, pid=os.getpid()
-        )
+
+def _port_in_use_message(port):
+    return (
+        f"Another process on your machine is already listening on port {port}. "
+        "It is possible that you have another instance of dagit "
+        "running somewhere using the same port. Or it could be another "
+        "random process. Either kill that process or use the -p option to "
+        "select another port."
     )
 
-    log_action(instance, START_DAGIT_WEBSERVER)
-    with uploading_logging_thread():
+
+def _find_free_port(host, start_port, max_attempts=DEFAULT_PORT_LOOKUP_ATTEMPTS):
+    """Return the first port at or above start_port that can be bound on host, probing with a
+    bare socket rather than standing up a full WSGI server for each candidate port."""
+    # Bind the probe the same way gevent binds the real listener: same address family choice and
+    # SO_REUSEADDR on POSIX, so ports left in TIME_WAIT by a previous dagit still count as free
+    family = socket.AF_INET6 if not host or ":" in host else socket.AF_INET
+    for port in range(start_port, start_port + max_attempts):
+        try:
+            with socket.socket(family, socket.SOCK_STREAM) as sock:
+                if not seven.IS_WINDOWS:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.bind((host or "", port))
+        except OSError:
+            continue
+        return port
+
+    raise Exception(
+        f"Unable to find a free port in the range {start_port}-{start_port + max_attempts - 1}. "
+        "Use the -p option to select a port."
+    )
+
+
+def start_server(instance, host, port, path_prefix, app, port_lookup):
+    from gevent import pywsgi
+    from geventwebsocket.handler import WebSocketHandler
+
+    def _serve(server_port):
+        server = pywsgi.WSGIServer((host, server_port), app, handler_class=WebSocketHandler)
+
+        click.echo(f"Serving on http://{host}:{server_port}{path_prefix} in process {os.getpid()}")
+
         try:
             server.serve_forever()
         except OSError as os_error:
             if "Address already in use" in str(os_error):
-                if port_lookup and (
-                    port_lookup_attempts > 0
-                    or click.confirm(
-                        (
-                            "Another process on your machine is already listening on port {port}. "
-                            "Would you like to run the app at another port instead?"
-                        ).format(port=port)
-                    )
-                ):
-                    port_lookup_attempts += 1
-                    start_server(
-                        instance,
-                        host,
-                        port + port_lookup_attempts,
-                        path_prefix,
-                        app,
-                        True,
-                        port_lookup_attempts,
-                    )
-                else:
-                    raise Exception(
-                        f"Another process on your machine is already listening on port {port}. "
-                        "It is possible that you have another instance of dagit "
-                        "running somewhere using the same port. Or it could be another "
-                        "random process. Either kill that process or use the -p option to "
-                        "select another port."
-                    ) from os_error
-            else:
-                raise os_error
+                raise DagitPortInUseError(_port_in_use_message(server_port)) from os_error
+            raise os_error
+
+    log_action(instance, START_DAGIT_WEBSERVER)
+    with uploading_logging_thread():
+        try:
+            _serve(port)
+        except DagitPortInUseError:
+            if not port_lookup or not click.confirm(
+                (
+                    "Another process on your machine is already listening on port {port}. "
+                    "Would you like to run the app at another port instead?"
+                ).format(port=port)
+            ):
+                raise
+
+            # Only probe for a free port once the requested one is known to be taken
+            _serve(_find_free_port(host, port + 1))
 
 
 cli = create_dagit_cli()
@@ -1,7 +1,10 @@
+import socket
 import subprocess
 
+import dagit.cli
+import pytest
 from click.testing import CliRunner
-from dagit.cli import ui
+from dagit.cli import _find_free_port, ui
 from dagster.utils import file_relative_path
 from gevent import pywsgi
 
@@ -18,7 +21,9 @@ def serve_forever(self):
             raise OSError("Address already in use")
 
     monkeypatch.setattr(pywsgi.WSGIServer, "serve_forever", serve_forever)
+    monkeypatch.setattr(dagit.cli, "_find_free_port", lambda host, start_port: start_port)
     runner = CliRunner()
+
     result = runner.invoke(
         ui,
         ["-f", file_relative_path(__file__, "./pipeline.py"), "-a", "test_repository"],
@@ -34,6 +39,26 @@ def serve_forever(self):
     assert ":3001" in result.output
 
 
+def test_find_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    assert _find_free_port("127.0.0.1", port) == port
+
+
+def test_find_free_port_skips_taken_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        taken_port = sock.getsockname()[1]
+
+        assert _find_free_port("127.0.0.1", taken_port) > taken_port
+
+        with pytest.raises(Exception, match="Unable to find a free port"):
+            _find_free_port("127.0.0.1", taken_port, max_attempts=1)
+
+
 def test_invoke_cli_wrapper_with_nonexistant_option():
     process = subprocess.Popen(["dagit", "--fubar"], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     _, stderr = process.communicate()
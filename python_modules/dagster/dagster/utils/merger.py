@@ -40,6 +40,9 @@ def merge_dicts(*args) -> dict:
     if len(args) < 2:
         check.failed(f"Expected 2 or more args to merge_dicts, found {len(args)}")
 
+    if len(args) == 2:
+        return {**args[0], **args[1]}
+
     result = args[0].copy()
     for arg in args[1:]:
         result.update(arg)
@@ -6,6 +6,10 @@
 
 from .merger import deep_merge_dicts
 
+# Prefer the libyaml-backed loader when PyYAML was built against libyaml; it parses the same
+# safe subset of YAML as yaml.SafeLoader, but much faster.
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml_from_globs(*globs):
     return load_yaml_from_glob_list(list(globs))
@@ -82,4 +86,4 @@ def merge_yaml_strings(yaml_strs):
 def load_yaml_from_path(path):
     check.str_param(path, "path")
     with open(path, "r") as ff:
-        return yaml.safe_load(ff)
+        return yaml.load(ff, Loader=YAML_SAFE_LOADER)
@@ -1,14 +1,16 @@
-from typing import Dict
+import re
 
 from setuptools import find_packages, setup  # type: ignore
 
 
 def get_version() -> str:
-    version: Dict[str, str] = {}
     with open("dagster_dbt/version.py") as fp:
-        exec(fp.read(), version)  # pylint: disable=W0122
+        match = re.search(r"^__version__\s*=\s*['\"]([^'\"]+)['\"]", fp.read(), re.M)
 
-    return version["__version__"]
+    if not match:
+        raise Exception("Unable to find __version__ in dagster_dbt/version.py")
+
+    return match.group(1)
 
 
 if __name__ == "__main__":
@@ -28,6 +30,7 @@ def get_version() -> str:
             "Operating System :: OS Independent",
         ],
         packages=find_packages(exclude=["test"]),
+        python_requires=">=3.6",
         install_requires=[
             "dagster",
             "dagster-pandas",
@@ -40,9 +43,9 @@ def get_version() -> str:
             "test": [
                 # https://github.com/dagster-io/dagster/issues/4167
                 "Jinja2<3.0",
-                "dbt>=0.17.0",
+                "dbt-core>=0.17.0",
+                "dbt-postgres>=0.17.0",
                 "matplotlib",
             ]
         },
-        zip_safe=False,
     )
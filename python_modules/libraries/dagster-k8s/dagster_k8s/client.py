@@ -1,15 +1,18 @@
 import logging
+import math
 import sys
 import time
 from enum import Enum
 
 import kubernetes
+import urllib3
 from dagster import DagsterInstance, check
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 
 DEFAULT_WAIT_TIMEOUT = 86400.0  # 1 day
 DEFAULT_WAIT_BETWEEN_ATTEMPTS = 10.0  # 10 seconds
 DEFAULT_JOB_POD_COUNT = 1  # expect job:pod to be 1:1 by default
+WATCH_REQUEST_TIMEOUT_PADDING = 5  # seconds
 
 
 class WaitForPodState(Enum):
@@ -114,6 +117,19 @@ def k8s_api_retry(
                 ) from e
 
 
+def _job_completion_timeout_error(job_name):
+    return DagsterK8sTimeoutError(
+        "Timed out while waiting for job {job_name} to complete".format(job_name=job_name)
+    )
+
+
+def _failed_job_error(job_name, namespace, status):
+    return DagsterK8sError(
+        "Encountered failed job pods for job {job_name} with status: {status}, "
+        "in namespace {namespace}".format(job_name=job_name, status=status, namespace=namespace)
+    )
+
+
 class KubernetesWaitingReasons:
     PodInitializing = "PodInitializing"
     ContainerCreating = "ContainerCreating"
@@ -249,10 +265,7 @@ def wait_for_job_success(
         # wait_time_between_attempts seconds
         while True:
             if self.timer() - start > wait_timeout:
-                raise DagsterK8sTimeoutError(
-                    "Timed out while waiting for job {job_name}"
-                    " to complete".format(job_name=job_name)
-                )
+                raise _job_completion_timeout_error(job_name)
 
             # Reads the status of the specified job. Returns a V1Job object that
             # we need to read the status off of.
@@ -272,12 +285,7 @@ def _get_job_status():
 
             # status.failed represents the number of pods which reached phase Failed.
             if status.failed and status.failed > 0:
-                raise DagsterK8sError(
-                    "Encountered failed job pods for job {job_name} with status: {status}, "
-                    "in namespace {namespace}".format(
-                        job_name=job_name, status=status, namespace=namespace
-                    )
-                )
+                raise _failed_job_error(job_name, namespace, status)
 
             if instance and run_id:
                 pipeline_run = instance.get_run_by_id(run_id)
@@ -290,6 +298,114 @@ def _get_job_status():
 
             self.sleeper(wait_time_between_attempts)
 
+    def wait_for_job_success_with_watch(
+        self,
+        job_name,
+        namespace,
+        wait_timeout=DEFAULT_WAIT_TIMEOUT,
+        wait_time_between_attempts=DEFAULT_WAIT_BETWEEN_ATTEMPTS,
+        num_pods_to_wait_for=DEFAULT_JOB_POD_COUNT,
+    ):
+        """Wait for a job to complete successfully, using a watch on the job rather than polling
+        its status. Returns as soon as the job reports success; the job does not need to exist
+        yet when this is called.
+
+        The watch is re-opened (resuming from the last seen resource version) whenever the stream
+        ends or the connection drops before wait_timeout has elapsed.
+
+        Args:
+            job_name (str): Name of the job to wait for.
+            namespace (str): Namespace in which the job is located.
+            wait_timeout (numeric, optional): Timeout after which to give up and raise exception.
+                Defaults to DEFAULT_WAIT_TIMEOUT.
+            wait_time_between_attempts (numeric, optional): Wait time before re-opening the watch
+                after an API or connection error. Defaults to DEFAULT_WAIT_BETWEEN_ATTEMPTS.
+
+        Raises:
+            DagsterK8sError: Raised when wait_timeout is exceeded or an error is encountered.
+        """
+        check.str_param(job_name, "job_name")
+        check.str_param(namespace, "namespace")
+        check.numeric_param(wait_timeout, "wait_timeout")
+        check.numeric_param(wait_time_between_attempts, "wait_time_between_attempts")
+        check.int_param(num_pods_to_wait_for, "num_pods_to_wait_for")
+
+        start = self.timer()
+        resource_version = None
+
+        def _watch_job_status():
+            """Stream events for the job until it succeeds or fails, returning its final status,
+            or None if the stream ended first or the deadline has already passed."""
+            nonlocal resource_version
+
+            # Recomputed on every call, since k8s_api_retry may call this again after an error
+            remaining = wait_timeout - (self.timer() - start)
+            if remaining <= 0:
+                return None
+
+            job_watch = kubernetes.watch.Watch()
+            kwargs = {
+                "namespace": namespace,
+                "field_selector": "metadata.name={}".format(job_name),
+                "timeout_seconds": math.ceil(remaining),
+                # Also bound the request client-side, in case the connection silently stalls
+                "_request_timeout": math.ceil(remaining) + WATCH_REQUEST_TIMEOUT_PADDING,
+            }
+            if resource_version:
+                kwargs["resource_version"] = resource_version
+
+            try:
+                for event in job_watch.stream(self.batch_api.list_namespaced_job, **kwargs):
+                    if event["type"] == "ERROR":
+                        # Most likely 410 Gone - our resource version is too old, so start over
+                        resource_version = None
+                        return None
+
+                    job = event["object"]
+                    resource_version = job.metadata.resource_version
+
+                    if event["type"] == "DELETED":
+                        raise DagsterK8sError(
+                            "Job {job_name} was deleted in namespace {namespace} before "
+                            "completing".format(job_name=job_name, namespace=namespace)
+                        )
+
+                    status = job.status
+                    if status and (
+                        status.succeeded == num_pods_to_wait_for
+                        or (status.failed and status.failed > 0)
+                    ):
+                        return status
+            except kubernetes.client.rest.ApiException as e:
+                if e.status != 410:
+                    raise
+                resource_version = None
+            finally:
+                job_watch.stop()
+
+            return None
+
+        while True:
+            if self.timer() - start >= wait_timeout:
+                raise _job_completion_timeout_error(job_name)
+
+            try:
+                status = k8s_api_retry(
+                    _watch_job_status, max_retries=3, timeout=wait_time_between_attempts
+                )
+            except urllib3.exceptions.HTTPError:
+                # Dropped or reset connection - re-open the watch
+                self.sleeper(wait_time_between_attempts)
+                continue
+
+            if status is None:
+                continue
+
+            if status.succeeded == num_pods_to_wait_for:
+                return
+
+            raise _failed_job_error(job_name, namespace, status)
+
     def delete_job(
         self,
         job_name,
@@ -1,10 +1,6 @@
 from dagster import check
-from dagster_k8s.utils import (
-    get_pod_names_in_job,
-    retrieve_pod_logs,
-    wait_for_job,
-    wait_for_job_success,
-)
+from dagster_k8s.client import DagsterKubernetesClient
+from dagster_k8s.utils import wait_for_job
 
 
 def wait_for_job_ready(job_name, namespace):
@@ -15,21 +11,26 @@ def wait_for_job_ready(job_name, namespace):
     wait_for_job(job_name=job_name, namespace=namespace)
 
 
-def wait_for_job_and_get_raw_logs(job_name, namespace, wait_timeout=300):
+def wait_for_job_and_get_raw_logs(job_name, namespace, wait_timeout=300, client=None):
     """Wait for a dagster-k8s job to complete, ensure it launched only one pod,
     and then grab the logs from the pod it launched.
 
     wait_timeout: default 5 minutes
+    client: an existing DagsterKubernetesClient to reuse; by default a new production client is
+        created
     """
     check.str_param(job_name, "job_name")
     check.str_param(namespace, "namespace")
+    check.opt_inst_param(client, "client", DagsterKubernetesClient)
 
-    wait_for_job_success(job_name, namespace=namespace, wait_timeout=wait_timeout)
+    client = client or DagsterKubernetesClient.production_client()
 
-    pod_names = get_pod_names_in_job(job_name, namespace)
+    client.wait_for_job_success_with_watch(job_name, namespace, wait_timeout=wait_timeout)
+
+    pod_names = client.get_pod_names_in_job(job_name, namespace)
 
     assert len(pod_names) == 1
 
     pod_name = pod_names[0]
 
-    return retrieve_pod_logs(pod_name, namespace=namespace)
+    return client.retrieve_pod_logs(pod_name, namespace=namespace)
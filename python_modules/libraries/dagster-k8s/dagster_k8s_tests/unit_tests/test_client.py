@@ -4,6 +4,7 @@
 
 import kubernetes
 import pytest
+import urllib3
 from dagster_k8s.client import (
     DagsterK8sAPIRetryLimitExceeded,
     DagsterK8sError,
@@ -329,6 +330,176 @@ def test_long_running_job():
     assert len(mock_client.sleeper.mock_calls) == 1
 
 
+#####
+# wait_for_job_success_with_watch tests
+#####
+
+
+def _job_event(event_type, succeeded=0, failed=0, resource_version="1"):
+    return {
+        "type": event_type,
+        "object": V1Job(
+            metadata=V1ObjectMeta(name="a_job", resource_version=resource_version),
+            status=V1JobStatus(failed=failed, succeeded=succeeded),
+        ),
+    }
+
+
+def _event_stream(*events, error=None):
+    yield from events
+    if error:
+        raise error
+
+
+@pytest.fixture(name="mock_watch")
+def mock_watch_fixture():
+    with mock.patch("kubernetes.watch.Watch") as mock_watch_cls:
+        yield mock_watch_cls.return_value
+
+
+def test_wait_for_job_success_with_watch(mock_watch):
+    mock_client = create_mocked_client()
+
+    mock_watch.stream.side_effect = [
+        _event_stream(_job_event("ADDED"), _job_event("MODIFIED", succeeded=1)),
+    ]
+
+    mock_client.wait_for_job_success_with_watch("a_job", "a_namespace")
+
+    assert len(mock_watch.stream.mock_calls) == 1
+    _, args, kwargs = mock_watch.stream.mock_calls[0]
+    assert args[0] == mock_client.batch_api.list_namespaced_job
+    assert kwargs["field_selector"] == "metadata.name=a_job"
+    assert kwargs["_request_timeout"] > kwargs["timeout_seconds"]
+    assert "resource_version" not in kwargs
+    assert mock_watch.stop.called
+
+    # sleeper should not have been called
+    assert not mock_client.sleeper.mock_calls
+
+
+def test_wait_for_job_success_with_watch_job_failed(mock_watch):
+    mock_client = create_mocked_client()
+
+    mock_watch.stream.side_effect = [_event_stream(_job_event("MODIFIED", failed=1))]
+
+    with pytest.raises(DagsterK8sError) as exc_info:
+        mock_client.wait_for_job_success_with_watch("a_job", "a_namespace")
+
+    assert "Encountered failed job pods for job a_job with status" in str(exc_info.value)
+
+
+def test_wait_for_job_success_with_watch_resumes_after_stream_ends(mock_watch):
+    mock_client = create_mocked_client()
+
+    mock_watch.stream.side_effect = [
+        _event_stream(_job_event("ADDED", resource_version="5")),
+        _event_stream(_job_event("MODIFIED", succeeded=1, resource_version="6")),
+    ]
+
+    mock_client.wait_for_job_success_with_watch("a_job", "a_namespace")
+
+    assert len(mock_watch.stream.mock_calls) == 2
+    _, _, kwargs = mock_watch.stream.mock_calls[1]
+    assert kwargs["resource_version"] == "5"
+
+
+def test_wait_for_job_success_with_watch_restarts_on_gone(mock_watch):
+    mock_client = create_mocked_client()
+
+    mock_watch.stream.side_effect = [
+        _event_stream(
+            _job_event("ADDED", resource_version="5"),
+            error=kubernetes.client.rest.ApiException(status=410, reason="Gone"),
+        ),
+        _event_stream(_job_event("MODIFIED", succeeded=1)),
+    ]
+
+    mock_client.wait_for_job_success_with_watch("a_job", "a_namespace")
+
+    assert len(mock_watch.stream.mock_calls) == 2
+    _, _, kwargs = mock_watch.stream.mock_calls[1]
+    assert "resource_version" not in kwargs
+
+
+def test_wait_for_job_success_with_watch_api_errors(mock_watch):
+    mock_client = create_mocked_client()
+
+    mock_watch.stream.side_effect = [
+        kubernetes.client.rest.ApiException(status=503, reason="Service unavailable"),
+        _event_stream(error=kubernetes.client.rest.ApiException(status=504, reason="Timeout")),
+        _event_stream(_job_event("MODIFIED", succeeded=1)),
+    ]
+
+    mock_client.wait_for_job_success_with_watch(
+        "a_job", "a_namespace", wait_time_between_attempts=0
+    )
+
+    # 2 attempts with errors + 1 SUCCESS
+    assert len(mock_watch.stream.mock_calls) == 3
+
+
+def test_wait_for_job_success_with_watch_unrecoverable_api_errors(mock_watch):
+    mock_client = create_mocked_client()
+
+    mock_watch.stream.side_effect = [
+        kubernetes.client.rest.ApiException(status=429, reason="Too many requests"),
+    ]
+
+    with pytest.raises(DagsterK8sUnrecoverableAPIError):
+        mock_client.wait_for_job_success_with_watch("a_job", "a_namespace")
+
+
+def test_wait_for_job_success_with_watch_connection_reset(mock_watch):
+    mock_client = create_mocked_client()
+
+    mock_watch.stream.side_effect = [
+        _event_stream(error=urllib3.exceptions.ProtocolError("Connection reset by peer")),
+        _event_stream(_job_event("MODIFIED", succeeded=1)),
+    ]
+
+    mock_client.wait_for_job_success_with_watch("a_job", "a_namespace")
+
+    assert len(mock_watch.stream.mock_calls) == 2
+    # slept once before re-opening the watch
+    assert len(mock_client.sleeper.mock_calls) == 1
+
+
+def test_wait_for_job_success_with_watch_timed_out(mock_watch):
+    mock_client = create_mocked_client(timer=create_timing_out_timer(num_good_ticks=2))
+
+    mock_watch.stream.side_effect = [_event_stream(_job_event("ADDED"))]
+
+    with pytest.raises(DagsterK8sError) as exc_info:
+        mock_client.wait_for_job_success_with_watch("a_job", "a_namespace")
+
+    assert str(exc_info.value) == "Timed out while waiting for job a_job to complete"
+    assert len(mock_watch.stream.mock_calls) == 1
+
+
+def test_wait_for_job_success_with_watch_no_retry_after_timeout(mock_watch):
+    # start, first deadline check and first watch are in time, the retry after the API error
+    # and the following deadline check are not
+    mock_timer = mock.MagicMock()
+    start = 1593697070.443257
+    mock_timer.side_effect = [start, start + 1, start + 2, start + TIMEOUT_GAP, start + TIMEOUT_GAP]
+    mock_client = create_mocked_client(timer=mock_timer)
+
+    mock_watch.stream.side_effect = [
+        _event_stream(error=kubernetes.client.rest.ApiException(status=503, reason="Unavailable")),
+        _event_stream(_job_event("MODIFIED", succeeded=1)),
+    ]
+
+    with pytest.raises(DagsterK8sError) as exc_info:
+        mock_client.wait_for_job_success_with_watch(
+            "a_job", "a_namespace", wait_time_between_attempts=0
+        )
+
+    assert str(exc_info.value) == "Timed out while waiting for job a_job to complete"
+    # the retry didn't re-open the watch once the deadline had passed
+    assert len(mock_watch.stream.mock_calls) == 1
+
+
 ###
 # retrieve_pod_logs
 ###